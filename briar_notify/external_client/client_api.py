@@ -3,6 +3,9 @@
 import json
 import time
 import sys
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -10,10 +13,12 @@ from typing import List, Optional, Dict, Any
 
 # Add project root to path so we can import internal_service as a package
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "briar_notify"))
+_package_path = str(project_root / "briar_notify")
+if _package_path not in sys.path:
+    sys.path.insert(0, _package_path)
 
 try:
-    from internal_service.briar_service import get_contacts, send_message, broadcast_message
+    from internal_service.briar_service import get_contacts, send_message, broadcast_message_to
     from internal_service.service_config import DEFAULT_BRIAR_PORT
     from internal_service.scheduler import get_scheduler
     from internal_service.dead_mans_switch import get_dead_mans_switch
@@ -21,10 +26,38 @@ except ImportError as e:
     sys.exit(1)
 
 
-def send(title: str, content: str, recipients: Optional[List[str]] = None, 
-         schedule: Optional[int] = None, json_payload: bool = False, 
-         dead_mans_switch: bool = False, reset_word: str = '', 
-         interval_seconds: int = 0) -> Dict[str, Any]:
+# Contacts change rarely compared to send frequency, so cache the list
+# (and the name->contact index built from it) briefly and skip both the
+# HTTP fetch and the index rebuild for bursts of send() calls.
+_CONTACTS_CACHE_TTL = 5  # seconds
+_contacts_cache = None  # (fetched_at, contacts, name_index)
+_contacts_lock = threading.Lock()
+
+
+def _contacts_snapshot():
+    """Get (contacts, name_to_contact) reusing a recent fetch when available.
+
+    Returns:
+        tuple: (contacts list or None, dict mapping contact name -> contact)
+    """
+    global _contacts_cache
+    with _contacts_lock:
+        now = time.monotonic()
+        if _contacts_cache and now - _contacts_cache[0] < _CONTACTS_CACHE_TTL:
+            return _contacts_cache[1], _contacts_cache[2]
+        contacts = get_contacts(DEFAULT_BRIAR_PORT)
+        if contacts is None:
+            return None, {}
+        name_index = {name: contact for contact in contacts
+                      if (name := contact.get('author', {}).get('name'))}
+        _contacts_cache = (now, contacts, name_index)
+        return contacts, name_index
+
+
+def send(title: str, content: str, recipients: Optional[List[str]] = None,
+         schedule: Optional[int] = None, json_payload: bool = False,
+         dead_mans_switch: bool = False, reset_word: str = '',
+         interval_seconds: int = 0, startup_grace: float = 0.0) -> Dict[str, Any]:
     """
     Send notification to contacts.
     
@@ -37,6 +70,8 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
         dead_mans_switch: Enable dead man's switch functionality (default: False)
         reset_word: Word/phrase to reset or disable the switch (required if dead_mans_switch=True)
         interval_seconds: Seconds until trigger (required if dead_mans_switch=True)
+        startup_grace: Optional seconds to wait before dispatching, for callers
+            that need to pace sends right after service start (default: 0.0)
 
     Returns:
         dict: {
@@ -87,7 +122,7 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
             )
             
             if success:
-                message_id = f"dms_{int(time.time())}_{hash(reset_word + content) % 10000:04d}"
+                message_id = f"dms_{int(time.time())}_{secrets.randbelow(10000):04d}"
                 scheduled_timestamp = int(time.time()) + interval_seconds
                 
                 return {
@@ -143,20 +178,14 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
     
     # Format message
     if json_payload:
-        # For scheduled messages, we'll add the timestamp when actually sent
-        if schedule is None:
-            message_text = json.dumps({
-                'title': title,
-                'content': content,
-                'sent_timestamp': int(time.time())
-            })
-        else:
-            # For scheduled messages, timestamp will be added when sent
-            message_text = json.dumps({
-                'title': title,
-                'content': content,
-                'sent_timestamp': None  # Will be updated when actually sent
-            })
+        # Keep the payload as a dict; sent_timestamp is stamped and the
+        # whole thing encoded once, immediately before dispatch
+        message_data = {
+            'title': title,
+            'content': content,
+            'sent_timestamp': None
+        }
+        message_text = None
     else:
         # For immediate sending, add timestamp now
         if schedule is None:
@@ -167,7 +196,7 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
             message_text = f"{title}\n\n{content}"
     
     # Generate message ID
-    message_id = f"msg_{int(time.time())}_{hash(title + content) % 10000:04d}"
+    message_id = f"msg_{int(time.time())}_{secrets.randbelow(10000):04d}"
     
     # Handle scheduled messages
     if schedule is not None:
@@ -209,28 +238,34 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
     
     # Send immediately
     sent_timestamp = int(time.time())
-    
-    # Update JSON payload with actual sent timestamp
+
+    # Stamp the actual send time and encode the payload a single time;
+    # the same encoded text is reused for every recipient
     if json_payload:
-        message_data = json.loads(message_text)
         message_data['sent_timestamp'] = sent_timestamp
         message_text = json.dumps(message_data)
     
-    # Add 10 second delay before sending
-    time.sleep(10)
-    
+    # Optional pacing for callers that need it (e.g. right after startup)
+    if startup_grace > 0:
+        time.sleep(startup_grace)
+
     try:
         if recipients is None:
-            # Broadcast to all contacts
-            result = broadcast_message(message_text, DEFAULT_BRIAR_PORT)
-            
+            # Broadcast to all contacts - fetch the list once and reuse it
+            # for both the broadcast and the response fields
+            contacts, _ = _contacts_snapshot()
+            if not contacts:
+                result = {'success': False, 'error': 'No contacts found or failed to get contacts'}
+            else:
+                result = broadcast_message_to(contacts, message_text, DEFAULT_BRIAR_PORT)
+
             if result.get('success'):
-                # Get contact names for response
-                contacts = get_contacts(DEFAULT_BRIAR_PORT) or []
-                contact_names = [contact.get('author', {}).get('name', f"Contact_{contact.get('contactId')}") 
-                               for contact in contacts]
-                delivered_contact_ids = [contact.get('contactId') for contact in contacts]
-                
+                contact_names = []
+                delivered_contact_ids = []
+                for contact in contacts:
+                    contact_names.append(contact.get('author', {}).get('name', f"Contact_{contact.get('contactId')}"))
+                    delivered_contact_ids.append(contact.get('contactId'))
+
                 return {
                     'success': True,
                     'message_id': message_id,
@@ -254,7 +289,7 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
         
         else:
             # Send to specific recipients
-            contacts = get_contacts(DEFAULT_BRIAR_PORT)
+            contacts, name_to_contact = _contacts_snapshot()
             if not contacts:
                 return {
                     'success': False,
@@ -266,32 +301,34 @@ def send(title: str, content: str, recipients: Optional[List[str]] = None,
                     'delivered_to': [],
                     'failed': recipients
                 }
-            
-            # Build name to contact mapping
-            name_to_contact = {}
-            for contact in contacts:
-                name = contact.get('author', {}).get('name')
-                if name:
-                    name_to_contact[name] = contact
-            
+
             delivered_to = []
             failed = []
-            
+
+            # Resolve names to contact IDs first, then fan out all sends
+            # concurrently - each send is a blocking HTTP call to Briar, so
+            # overlapping them collapses N round-trips into roughly one.
+            pairs = []
             for recipient_name in recipients:
                 if recipient_name in name_to_contact:
                     contact = name_to_contact[recipient_name]
-                    contact_id = contact.get('contactId')
-                    
-                    result = send_message(contact_id, message_text, DEFAULT_BRIAR_PORT)
-                    if result:
-                        delivered_to.append(contact_id)
-                    else:
-                        failed.append(recipient_name)
-                    # Add delay between individual sends
-                    time.sleep(10)
+                    pairs.append((contact.get('contactId'), recipient_name))
                 else:
                     failed.append(recipient_name)
-            
+
+            if pairs:
+                with ThreadPoolExecutor(max_workers=min(len(pairs), 16)) as executor:
+                    futures = {
+                        executor.submit(send_message, contact_id, message_text, DEFAULT_BRIAR_PORT): (contact_id, recipient_name)
+                        for contact_id, recipient_name in pairs
+                    }
+                    for future in as_completed(futures):
+                        contact_id, recipient_name = futures[future]
+                        if future.result():
+                            delivered_to.append(contact_id)
+                        else:
+                            failed.append(recipient_name)
+
             success = len(failed) == 0
             
             return {
@@ -331,31 +368,27 @@ def _send_immediate_message(message_text: str, recipients: Optional[List[str]] =
     try:
         if recipients is None:
             # Broadcast to all contacts
-            result = broadcast_message(message_text, DEFAULT_BRIAR_PORT)
-            return result
+            contacts, _ = _contacts_snapshot()
+            if not contacts:
+                return {'success': False, 'error': 'No contacts found or failed to get contacts'}
+            return broadcast_message_to(contacts, message_text, DEFAULT_BRIAR_PORT)
         else:
             # Send to specific recipients
-            contacts = get_contacts(DEFAULT_BRIAR_PORT)
+            contacts, name_to_contact = _contacts_snapshot()
             if not contacts:
                 return {'success': False, 'error': 'No contacts found'}
-            
-            # Build name to contact mapping
-            name_to_contact = {}
-            for contact in contacts:
-                name = contact.get('author', {}).get('name')
-                if name:
-                    name_to_contact[name] = contact
-            
+
+            # Fan out all sends concurrently (same pattern as send())
+            contact_ids = [name_to_contact[name].get('contactId')
+                           for name in recipients if name in name_to_contact]
+
             delivered_count = 0
-            for recipient_name in recipients:
-                if recipient_name in name_to_contact:
-                    contact = name_to_contact[recipient_name]
-                    contact_id = contact.get('contactId')
-                    
-                    result = send_message(contact_id, message_text, DEFAULT_BRIAR_PORT)
-                    if result:
-                        delivered_count += 1
-            
+            if contact_ids:
+                with ThreadPoolExecutor(max_workers=min(len(contact_ids), 16)) as executor:
+                    futures = [executor.submit(send_message, contact_id, message_text, DEFAULT_BRIAR_PORT)
+                               for contact_id in contact_ids]
+                    delivered_count = sum(1 for future in futures if future.result())
+
             return {
                 'success': delivered_count > 0,
                 'delivered_count': delivered_count,
@@ -11,7 +11,9 @@ from flask import request, jsonify
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "briar_notify"))
+_package_path = str(project_root / "briar_notify")
+if _package_path not in sys.path:
+    sys.path.insert(0, _package_path)
 
 from external_client.client_api import send
 
@@ -5,10 +5,16 @@ import sys
 import time
 import json
 import secrets
+import shutil
+import signal
 import subprocess
 import tempfile
+import functools
+import threading
 from pathlib import Path
 
+import requests
+
 # Configuration
 BRIAR_CONFIG_DIR = Path.home() / ".briar-notify"
 BRIAR_PASSWORD_FILE = BRIAR_CONFIG_DIR / "briar-password"
@@ -24,7 +30,9 @@ else:
     # We're in production install
     INSTALL_DIR = Path("/opt/briar-notify")
 
-sys.path.insert(0, str(INSTALL_DIR / "briar_notify"))
+_package_path = str(INSTALL_DIR / "briar_notify")
+if _package_path not in sys.path:
+    sys.path.insert(0, _package_path)
 
 from internal_service.service_config import JAVA_PATH, jar_arch
 from internal_service.briar_service import get_identity_name
@@ -37,10 +45,56 @@ def generate_secure_password():
     """Generate cryptographically secure password."""
     return secrets.token_urlsafe(32)
 
+@functools.lru_cache(maxsize=1)
 def get_briar_jar_path():
     """Get architecture-specific Briar JAR path."""
     return INSTALL_DIR / "briar_headless" / "jar-builds" / "jars" / f"briar-headless-{jar_arch}.jar"
 
+@functools.lru_cache(maxsize=None)
+def _path_exists(path):
+    """Stat a bundled path once per process - JAR/JDK paths never move."""
+    return Path(path).exists()
+
+def _write_secret(path, data):
+    """Write a file that is 0600 from the moment it exists.
+
+    Creating with write_text and chmod'ing afterwards leaves a window
+    where the file is readable under the default umask; creating the fd
+    with the final mode closes it (and saves the extra chmod syscall).
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data.encode())
+    finally:
+        os.close(fd)
+
+def kill_stale_briar_processes():
+    """Kill any stray briar-headless processes by scanning /proc in-process.
+
+    Avoids forking pkill (a fork/exec plus its own process-table scan)
+    for what amounts to a handful of file reads.
+    """
+    for cmdline in Path('/proc').glob('[0-9]*/cmdline'):
+        try:
+            if b'briar-headless' in cmdline.read_bytes():
+                os.kill(int(cmdline.parent.name), signal.SIGKILL)
+        except (OSError, ValueError):
+            continue
+
+def stop_process(process, timeout=2):
+    """Terminate a tracked subprocess, escalating to SIGKILL if needed."""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            pass
+
 def create_identity(nickname):
     """Create new Briar identity with auto-generated password."""
     check_root()
@@ -65,11 +119,11 @@ def create_identity(nickname):
     # Clean any existing Briar data
     if BRIAR_DATA_DIR.exists():
         print("Cleaning existing Briar data...")
-        subprocess.run(['rm', '-rf', str(BRIAR_DATA_DIR)], check=False)
+        shutil.rmtree(BRIAR_DATA_DIR, ignore_errors=True)
     
     # Kill any running Briar processes
     print("Stopping any running Briar processes...")
-    subprocess.run(['pkill', '-9', '-f', 'briar-headless'], check=False)
+    kill_stale_briar_processes()
     time.sleep(2)
     
     # Prepare identity creation input
@@ -79,11 +133,11 @@ def create_identity(nickname):
     print("Starting Briar identity creation...")
     jar_path = get_briar_jar_path()
     
-    if not jar_path.exists():
+    if not _path_exists(str(jar_path)):
         print(f"ERROR: Briar JAR not found: {jar_path}")
         sys.exit(1)
-    
-    if not Path(JAVA_PATH).exists():
+
+    if not _path_exists(JAVA_PATH):
         print(f"ERROR: Java not found: {JAVA_PATH}")
         sys.exit(1)
     
@@ -98,39 +152,46 @@ def create_identity(nickname):
             cwd=str(INSTALL_DIR)
         )
         
-        # Send identity creation data
-        process.stdin.write(input_data)
-        process.stdin.close()
+        # Feed stdin and drain stdout/stderr in a background thread so the
+        # Java child can never stall on a full pipe buffer, while the main
+        # thread runs the readiness probe concurrently
+        def _feed_process():
+            try:
+                process.communicate(input=input_data)
+            except Exception:
+                pass
+
+        io_thread = threading.Thread(target=_feed_process, daemon=True)
+        io_thread.start()
         
-        # Wait for Briar API to be ready (identity creation is asynchronous)
+        # Wait for Briar API to be ready (identity creation is asynchronous).
+        # Poll with exponential backoff (50ms -> 1s) so a fast startup is
+        # detected in tens of milliseconds instead of a fixed 1s floor.
         print("Waiting for Briar API to be ready...")
         api_ready = False
-        
-        for i in range(30):  # Wait up to 30 seconds
-            time.sleep(1)
-            
+        started = time.monotonic()
+        deadline = started + 30
+        delay = 0.05
+        session = requests.Session()  # reuse one connection across probes
+
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+
             # Check if process is still running
             if process.poll() is not None:
                 print(f"Briar process exited with code: {process.returncode}")
                 break
-                
-            # Check if API is responding
+
+            # Check if API is responding (401 = up, just no auth token yet)
             try:
-                import requests
-                response = requests.get(f'http://localhost:7010/v1/contacts/add/link', timeout=2)
-                if response.status_code == 401:  # Expected - no auth token yet, but API is up
-                    api_ready = True
-                    print(f"Briar API ready after {i+1} seconds")
-                    break
-                elif response.status_code == 200:
+                response = session.get('http://localhost:7010/v1/contacts/add/link', timeout=2)
+                if response.status_code in (200, 401):
                     api_ready = True
-                    print(f"Briar API ready after {i+1} seconds")
+                    print(f"Briar API ready after {time.monotonic() - started:.1f} seconds")
                     break
             except:
                 pass  # API not ready yet
-                
-            if i % 5 == 0:
-                print(f"Still waiting... ({i+1}/30)")
         
         # Kill the process after identity creation
         # if process.poll() is None:
@@ -143,23 +204,22 @@ def create_identity(nickname):
             print("WARNING: API did not become ready, but identity may still have been created")
         
         # Save password to user directory
-        BRIAR_PASSWORD_FILE.write_text(password)
-        os.chmod(BRIAR_PASSWORD_FILE, 0o600)  # -rw-------
-        
-        # Save identity metadata file  
-        BRIAR_IDENTITY_FILE.write_text(json.dumps({
+        _write_secret(BRIAR_PASSWORD_FILE, password)
+
+        # Save identity metadata file
+        _write_secret(BRIAR_IDENTITY_FILE, json.dumps({
             "nickname": nickname,
             "created": time.time()
         }))
-        os.chmod(BRIAR_IDENTITY_FILE, 0o600)  # -rw-------
         
         print(f"Identity '{nickname}' created successfully")
         print(f"Password stored securely in: {BRIAR_PASSWORD_FILE}")
         
-        # Kill the temporary JAR process
+        # Kill the temporary JAR process - we hold its Popen handle, so
+        # signal it directly instead of shelling out to pkill
         print("Stopping temporary Briar process...")
-        subprocess.run(['pkill', '-9', '-f', 'briar-headless'], check=False)
-        time.sleep(1)
+        stop_process(process)
+        io_thread.join(timeout=5)
         
         print()
         print("Identity creation complete!")
@@ -169,7 +229,7 @@ def create_identity(nickname):
     except Exception as e:
         print(f"ERROR: Failed to create identity: {e}")
         # Kill any temporary JAR process
-        subprocess.run(['pkill', '-9', '-f', 'briar-headless'], check=False)
+        kill_stale_briar_processes()
         # Cleanup on failure
         if BRIAR_PASSWORD_FILE.exists():
             BRIAR_PASSWORD_FILE.unlink()
@@ -198,7 +258,7 @@ def delete_identity():
     
     # Stop any running processes
     print("Stopping Briar processes...")
-    subprocess.run(['pkill', '-9', '-f', 'briar-headless'], check=False)
+    kill_stale_briar_processes()
     time.sleep(2)
     
     # Remove password files
@@ -212,7 +272,7 @@ def delete_identity():
     
     # Remove Briar data directory
     if BRIAR_DATA_DIR.exists():
-        subprocess.run(['rm', '-rf', str(BRIAR_DATA_DIR)], check=False)
+        shutil.rmtree(BRIAR_DATA_DIR, ignore_errors=True)
         print("Removed Briar data directory")
     
     print("Identity deleted successfully")
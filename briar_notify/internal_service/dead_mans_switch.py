@@ -1,18 +1,165 @@
 #!/usr/bin/env python3
 
-import json
+import os
+import re
 import sys
-import time
+
+import orjson
 from datetime import datetime, timedelta
 from typing import Optional
 from internal_service.scheduler import get_scheduler
-from internal_service.briar_service import send_message, get_contacts
+from internal_service.briar_service import send_message_async
 from internal_service.service_config import BRIAR_NOTIFY_DIR
 
+# Matches 'end' only as a whole word, so messages like 'sending the reset
+# word' or 'legend' don't get misread as a disable command
+_END_RE = re.compile(r'\bend\b')
+
 
 class DeadMansSwitch:
     def __init__(self):
         self.scheduler = get_scheduler()
+        self.messages_path = BRIAR_NOTIFY_DIR / 'scheduled_messages.json'
+        self.index_path = BRIAR_NOTIFY_DIR / 'reset_words.json'
+        self._cache_key = None  # (st_mtime_ns, st_size) the cache was built from
+        self._cache = ([], {})
+        self._index_key = None  # key for the standalone reset-word index
+        self._index = {}
+        self._matcher_source = None  # the index dict the compiled matcher was built from
+        self._matcher = None
+
+    def _load_messages(self):
+        """Load the scheduled messages list in one pass.
+
+        Returns:
+            list: Scheduled message dicts ([] if the file is missing/corrupt)
+        """
+        try:
+            return orjson.loads(self.messages_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return []
+
+    def _load_messages_cached(self):
+        """Load messages plus a reset-word index, one file read for all uses.
+
+        The parsed list and the derived index are reused until the file
+        changes on disk, so handling an incoming message costs a stat
+        instead of a full read+parse per lookup.
+
+        Returns:
+            tuple: (messages, reset_word_index) where reset_word_index maps
+                lowercase reset word -> {'interval': seconds, 'main_content':
+                content of the main triggered message or None}
+        """
+        try:
+            st = self.messages_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            self._cache_key = None
+            self._cache = ([], {})
+            return self._cache
+
+        if key != self._cache_key:
+            messages = self._load_messages()
+            reset_index = {}
+            for msg in messages:
+                if msg.get('dead_mans_switch') and msg.get('reset_word'):
+                    word = msg['reset_word'].lower()
+                    entry = reset_index.setdefault(word, {
+                        'interval': msg.get('original_interval_seconds', 0),
+                        'main_content': None
+                    })
+                    if msg.get('title', '').startswith('Dead Man\'s Switch - Triggered'):
+                        entry['main_content'] = msg.get('content', '')
+            self._cache = (messages, reset_index)
+            self._cache_key = key
+            self._write_index_sidecar(key, reset_index)
+
+        return self._cache
+
+    def _write_index_sidecar(self, key, reset_index):
+        """Persist the reset-word index next to the message store.
+
+        The sidecar records which version of the messages file it was
+        derived from, so other processes (and fresh restarts) can answer
+        reset-word lookups from a few bytes instead of parsing the full
+        store. Best-effort - the full store remains authoritative.
+        """
+        try:
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps({'key': list(key), 'index': reset_index}))
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            pass
+
+    def _load_reset_index(self):
+        """Get the reset-word index without parsing the full message store.
+
+        Prefers the in-memory caches, then the sidecar file (when it was
+        derived from the current messages file), and only falls back to a
+        full parse when everything is stale. The resolved index is held
+        per store version, so a steady stream of messages costs one stat
+        and a dict return each - no re-reads, no fresh dicts.
+
+        Returns:
+            dict: lowercase reset word -> {'interval', 'main_content'}
+        """
+        try:
+            st = self.messages_path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return {}
+
+        if key == self._index_key:
+            return self._index
+
+        if key == self._cache_key:
+            index = self._cache[1]
+        else:
+            index = None
+            try:
+                sidecar = orjson.loads(self.index_path.read_bytes())
+                if sidecar.get('key') == list(key):
+                    index = sidecar.get('index', {})
+            except Exception:
+                pass
+            if index is None:
+                index = self._load_messages_cached()[1]
+
+        self._index_key = key
+        self._index = index
+        return index
+
+    def _get_matcher(self, active_reset_words):
+        """Get a compiled pattern matching any active reset word in one scan.
+
+        A single regex alternation finds the first occurrence of any reset
+        word in one pass over the message instead of one substring search
+        per word. Index dicts are never mutated after they're built, so an
+        identity check on the dict is enough to know the matcher is still
+        current - the steady-state per-message cost is one `is` comparison
+        with zero allocations. Longer words are tried first so overlapping
+        words match their longest form.
+
+        Returns:
+            re.Pattern: Matches any active reset word, or None if there are none
+        """
+        if active_reset_words is not self._matcher_source:
+            if active_reset_words:
+                alternation = '|'.join(
+                    re.escape(word)
+                    for word in sorted(active_reset_words, key=len, reverse=True))
+                self._matcher = re.compile(alternation)
+            else:
+                self._matcher = None
+            self._matcher_source = active_reset_words
+        return self._matcher
+
+    def _invalidate_cache(self):
+        """Drop the cached messages/index after writing the file."""
+        self._cache_key = None
+        self._index_key = None
     
     def schedule_dead_mans_switch(self, interval_seconds: int, main_message: str, 
                                  reset_word: str, contact_id: Optional[str] = None) -> bool:
@@ -73,8 +220,12 @@ class DeadMansSwitch:
                 reset_word=reset_word.lower(),
                 original_interval_seconds=interval_seconds
             )
+
+            # The scheduler just rewrote the message store
+            self._invalidate_cache()
+
             return True
-            
+
         except Exception as e:
             return False
     
@@ -92,43 +243,26 @@ class DeadMansSwitch:
         
         message_lower = message_text.lower().strip()
         
-        # Get all unique reset words from scheduled messages
+        # Get all active reset words (cached against the file's mtime)
         try:
-            messages_path = BRIAR_NOTIFY_DIR / 'scheduled_messages.json'
-            
-            try:
-                with open(messages_path, 'r') as f:
-                    messages = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                return
-            
-            # Get all unique reset words from active dead man's switch messages
-            active_reset_words = {}
-            for msg in messages:
-                if msg.get('dead_mans_switch') and msg.get('reset_word'):
-                    reset_word = msg['reset_word'].lower()
-                    if reset_word not in active_reset_words:
-                        active_reset_words[reset_word] = msg.get('original_interval_seconds', 0)
-            
+            active_reset_words = self._load_reset_index()
             if not active_reset_words:
                 return
-            
-            # Check if incoming message contains any active reset words
-            found_reset_word = None
-            original_interval = 0
-            for reset_word, interval in active_reset_words.items():
-                if reset_word in message_lower:
-                    found_reset_word = reset_word
-                    original_interval = interval
-                    break
-            
-            if not found_reset_word:
+
+            # Check if incoming message contains any active reset words,
+            # scanning the text once for all of them
+            matcher = self._get_matcher(active_reset_words)
+            match = matcher.search(message_lower) if matcher else None
+            if not match:
                 return
+
+            found_reset_word = match.group()
+            original_interval = active_reset_words[found_reset_word]['interval']
             
             # Process the single matching reset word
             
             # Check if this is a disable command (reset word + "end")
-            if "end" in message_lower:
+            if _END_RE.search(message_lower):
                 success = self._disable_dead_mans_switch(found_reset_word, contact_id)
                 if success:
                     self._send_confirmation(contact_id, "Dead man's switch has been permanently disabled.")
@@ -196,19 +330,12 @@ class DeadMansSwitch:
             str: Main message content, or None if not found
         """
         try:
-            messages_path = BRIAR_NOTIFY_DIR / 'scheduled_messages.json'
-            
-            with open(messages_path, 'r') as f:
-                messages = json.load(f)
-            
-            for msg in messages:
-                if (msg.get('dead_mans_switch') and 
-                    msg.get('reset_word', '').lower() == reset_word.lower() and
-                    msg.get('title', '').startswith('Dead Man\'s Switch - Triggered')):
-                    return msg.get('content', '')
-            
+            reset_index = self._load_reset_index()
+            entry = reset_index.get(reset_word.lower())
+            if entry:
+                return entry['main_content']
             return None
-            
+
         except Exception as e:
             return None
     
@@ -222,31 +349,33 @@ class DeadMansSwitch:
             bool: True if successful, False otherwise
         """
         try:
-            messages_path = BRIAR_NOTIFY_DIR / 'scheduled_messages.json'
-            
-            try:
-                with open(messages_path, 'r') as f:
-                    messages = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
+            messages, _ = self._load_messages_cached()
+            if not messages:
                 return True
-            
-            # Filter out messages with matching reset word
-            original_count = len(messages)
-            remaining_messages = []
-            deleted_count = 0
-            
-            for msg in messages:
-                if (msg.get('dead_mans_switch') and 
-                    msg.get('reset_word', '').lower() == reset_word.lower()):
-                    deleted_count += 1
-                else:
-                    remaining_messages.append(msg)
-            
-            # Save updated messages
-            with open(messages_path, 'w') as f:
-                json.dump(remaining_messages, f, indent=2)
-            
-            
+
+            # Filter out messages with matching reset word; lowercase the
+            # target once instead of per row (stored words are already
+            # lowercased at insert time)
+            target = reset_word.lower()
+            remaining_messages = [msg for msg in messages
+                                  if not (msg.get('dead_mans_switch')
+                                          and msg.get('reset_word', '').lower() == target)]
+
+            # Most messages match nothing - skip the rewrite entirely
+            if len(remaining_messages) == len(messages):
+                return True
+
+            # Atomic rewrite: write a temp file, fsync, then rename over the
+            # original so a crash mid-write can't leave a torn file behind
+            tmp_path = self.messages_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(remaining_messages))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.messages_path)
+
+            self._invalidate_cache()
+
             return True
             
         except Exception as e:
@@ -260,11 +389,10 @@ class DeadMansSwitch:
             message: Confirmation message text
         """
         try:
-            # Add 1 second delay before responding
-            time.sleep(1)
-            result = send_message(contact_id, message)
-            if result:
-                pass
+            # Hand the send to the shared worker pool so the event-listener
+            # thread isn't parked on the HTTP round-trip; the API is
+            # necessarily up since Briar just delivered the inbound message
+            send_message_async(contact_id, message)
         except Exception as e:
             pass
 
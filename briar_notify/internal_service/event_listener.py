@@ -1,9 +1,20 @@
 
-import json, threading, websocket
+import threading, orjson, websocket
 from internal_service.service_config import auth_manager, WS_URL
 from internal_service.dead_mans_switch import get_dead_mans_switch
 
 class BriarEventListener:
+    # Dispatch table built once at class level: event name -> method name.
+    # on_event previously rebuilt a dict of five closures per frame; now
+    # dispatch is a single dict lookup plus getattr.
+    _HANDLERS = {
+        "ContactConnectedEvent": "_evt_contact_connected",
+        "ContactDisconnectedEvent": "_evt_contact_disconnected",
+        "ConversationMessageReceivedEvent": "_handle_conversation_message",
+        "MessagesSentEvent": "_evt_messages_sent",
+        "MessagesAckedEvent": "_evt_messages_acked",
+    }
+
     def __init__(self, url: str = WS_URL):
         self.url = url
         self._thread = None
@@ -29,24 +40,16 @@ class BriarEventListener:
 
         def on_event(ws, raw):
             try:
-                evt = json.loads(raw)
+                evt = orjson.loads(raw)
             except Exception:
                 return
 
             name = evt.get("name")
             data = evt.get("data") or {}
 
-            event_handlers = {
-                "ContactConnectedEvent": lambda: self.on_contact_connected(data.get("contactId")),
-                "ContactDisconnectedEvent": lambda: self.on_contact_disconnected(data.get("contactId")),
-                "ConversationMessageReceivedEvent": lambda: self._handle_conversation_message(data),
-                "MessagesSentEvent": lambda: self.on_messages_sent(data.get("contactId"), data.get("messageIds", [])),
-                "MessagesAckedEvent": lambda: self.on_messages_acked(data.get("contactId"), data.get("messageIds", [])),
-            }
-
-            handler = event_handlers.get(name)
-            if handler:
-                handler()
+            handler_name = self._HANDLERS.get(name)
+            if handler_name:
+                getattr(self, handler_name)(data)
             else:
                 self.on_other_event(name, data)
 
@@ -54,6 +57,18 @@ class BriarEventListener:
             self.url, on_open=on_open, on_message=on_event
         ).run_forever(ping_interval=30, ping_timeout=10)
 
+    def _evt_contact_connected(self, data):
+        self.on_contact_connected(data.get("contactId"))
+
+    def _evt_contact_disconnected(self, data):
+        self.on_contact_disconnected(data.get("contactId"))
+
+    def _evt_messages_sent(self, data):
+        self.on_messages_sent(data.get("contactId"), data.get("messageIds", []))
+
+    def _evt_messages_acked(self, data):
+        self.on_messages_acked(data.get("contactId"), data.get("messageIds", []))
+
     def _handle_conversation_message(self, data):
         # All 1:1 text messages (both incoming and outgoing)
         if data.get("type") == "PrivateMessage":
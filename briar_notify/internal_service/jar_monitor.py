@@ -1,4 +1,3 @@
-import time
 import threading
 from typing import Optional
 from internal_service.briar_service import identity_running, start_briar_process, logout_identity, wait_for_briar_ready
@@ -12,13 +11,15 @@ class JarMonitor:
         self.check_interval_seconds = 60
         self.running = False
         self.monitor_thread: Optional[threading.Thread] = None
-        
+        self._stop_evt = threading.Event()
+
     def start_monitoring(self) -> bool:
         # Start the background monitoring thread.
         if self.running:
             return False
-            
+
         self.running = True
+        self._stop_evt.clear()
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop,
             name="JarMonitor",
@@ -26,26 +27,30 @@ class JarMonitor:
         )
         self.monitor_thread.start()
         return True
-        
+
     def stop_monitoring(self):
         # Stop the background monitoring thread.
         if not self.running:
             return
-            
+
         self.running = False
+        self._stop_evt.set()
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
-        
+
     def _monitor_loop(self):
-        # Main monitoring loop - runs in background thread.
-        while self.running:
+        # Main monitoring loop - runs in background thread. Sleeping on
+        # the event (instead of time.sleep) keeps the thread fully idle
+        # between checks yet lets stop_monitoring wake it immediately.
+        while not self._stop_evt.is_set():
             try:
                 if not identity_running():
                     self._restart_jar()
             except Exception:
                 pass
+            self._stop_evt.wait(self.check_interval_seconds)
+
 
-                
     def _restart_jar(self) -> bool:
         # Restart the JAR process.
         try:
@@ -53,9 +58,8 @@ class JarMonitor:
             if not system_password:
                 return False
                 
-            logout_identity()
-            time.sleep(2)
-            
+            logout_identity()  # blocks until the API port is released
+
             proc = start_briar_process(system_password)
             if not proc:
                 return False
@@ -1,36 +1,72 @@
 import os
+import hmac
 import json
 import time
+import ctypes
+import hashlib
 import secrets
 import base64
 from pathlib import Path
 from typing import Dict, Any, Optional
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+import orjson
+
 from internal_service.service_config import BRIAR_NOTIFY_DIR
 
+# PBKDF2 parameters shared by hash creation and verification
+PBKDF2_ITERATIONS = 480000
+PBKDF2_KEY_LENGTH = 32
+
+
+def _read_small(path) -> bytes:
+    """Read a tiny file (password token, hash JSON) in two syscalls.
+
+    Skips the text-mode wrapper's codec and buffering layers, which are
+    pure overhead for sub-4KiB files read on every login.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        bytes: File contents (up to 4 KiB)
+    """
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
 
 class SecurePassword:
     def __init__(self, password: str):
         self._data = bytearray(password.encode('utf-8'))
+        # Keep the decoded str alongside the bytearray so every read
+        # doesn't re-decode and allocate; clear() drops this reference
+        self._str = password
         self._last_access = time.time()
-    
+
     def get_bytes(self) -> bytes:
         self._last_access = time.time()
         return bytes(self._data)
-    
+
     def get_string(self) -> str:
         self._last_access = time.time()
-        return self._data.decode('utf-8')
+        return self._str
     
     def is_expired(self, timeout_seconds: int = 3600) -> bool:
         return time.time() - self._last_access > timeout_seconds
     
     def clear(self):
-        # Zero out the bytearray
-        for i in range(len(self._data)):
-            self._data[i] = 0
+        # Zero out the bytearray with a single libc memset instead of a
+        # Python loop; writing through ctypes also guarantees the bytes
+        # are actually overwritten before the buffer is released
+        n = len(self._data)
+        if n:
+            buf = (ctypes.c_char * n).from_buffer(self._data)
+            ctypes.memset(ctypes.addressof(buf), 0, n)
+            del buf  # release the buffer export so the bytearray can resize
         self._data.clear()
+        self._str = None
 
 
 class PasswordManager:
@@ -39,6 +75,7 @@ class PasswordManager:
         self._session_timeout = None  # No timeout for always-on server
         # Use user accessible directory for now (can be moved to system location later with proper setup)
         self.system_password_file = BRIAR_NOTIFY_DIR / "briar-password"
+        self._hash_cache = None  # (path, mtime_ns, salt, stored_hash)
     
     def generate_secure_password(self) -> str:
         """Generate cryptographically secure password for Briar identity.
@@ -88,8 +125,7 @@ class PasswordManager:
         """
         try:
             if self.system_password_file.exists():
-                with open(self.system_password_file, 'r') as f:
-                    return f.read().strip()
+                return _read_small(self.system_password_file).decode().strip()
             return None
         except Exception as e:
             print(f"Failed to load system password: {e}")
@@ -185,7 +221,7 @@ class PasswordManager:
         """
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f)
     
     def load_file(self, filepath: Path) -> Dict[str, Any]:
         """Load data from plaintext JSON file.
@@ -211,14 +247,11 @@ class PasswordManager:
         # Generate random salt for verification hash
         salt = os.urandom(16)
         
-        # Create PBKDF2 hash with same parameters as derive_key_from_password
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=480000,
-        )
-        password_hash = kdf.derive(password.encode())
+        # Create PBKDF2 hash with same parameters as derive_key_from_password.
+        # hashlib.pbkdf2_hmac runs the whole iteration loop inside OpenSSL's
+        # C implementation (with hardware-accelerated SHA256 where available)
+        password_hash = hashlib.pbkdf2_hmac(
+            'sha256', password.encode(), salt, PBKDF2_ITERATIONS, PBKDF2_KEY_LENGTH)
         
         # Save hash and salt to file using identity name
         hash_file = BRIAR_NOTIFY_DIR / f'{identity_name}.hash'
@@ -231,56 +264,79 @@ class PasswordManager:
         
         with open(hash_file, 'w') as f:
             json.dump(hash_data, f)
-    
-    def verify_password(self, password: str) -> bool:
-        """Verify password against stored PBKDF2 hash.
-        
-        Args:
-            password: Password to verify
-            
+
+        self._hash_cache = None  # Pick up the new hash on next verify
+
+    def _load_hash_cached(self) -> Optional[tuple]:
+        """Load the verification salt and hash, reusing the decoded values.
+
+        The directory glob, JSON parse, and base64 decode are repeated
+        work on every verification attempt; the result is cached against
+        the hash file's mtime so steady-state calls skip straight to the
+        PBKDF2 check.
+
         Returns:
-            bool: True if password matches hash
+            tuple: (salt_bytes, stored_hash_bytes), or None if no hash exists
         """
+        cached = self._hash_cache
+        if cached is not None:
+            try:
+                if cached[0].stat().st_mtime_ns == cached[1]:
+                    return cached[2], cached[3]
+            except OSError:
+                pass
+            self._hash_cache = None
+
         # Find any .hash file in the directory
         hash_files = list(BRIAR_NOTIFY_DIR.glob('*.hash'))
         if not hash_files:
-            return False
-        
+            return None
+
         # Use the first .hash file found
         hash_file = hash_files[0]
-        
+
         try:
-            with open(hash_file, 'r') as f:
-                hash_data = json.load(f)
-            
-            stored_hash = base64.b64decode(hash_data['hash'])
+            mtime_ns = hash_file.stat().st_mtime_ns
+            hash_data = orjson.loads(_read_small(hash_file))
+
             salt = base64.b64decode(hash_data['salt'])
-            
-            # Verify password using same PBKDF2 parameters
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=480000,
-            )
-            
-            try:
-                kdf.verify(password.encode(), stored_hash)
-                return True
-            except Exception:
-                return False
-                
+            stored_hash = base64.b64decode(hash_data['hash'])
+        except Exception:
+            return None
+
+        self._hash_cache = (hash_file, mtime_ns, salt, stored_hash)
+        return salt, stored_hash
+
+    def verify_password(self, password: str) -> bool:
+        """Verify password against stored PBKDF2 hash.
+
+        Args:
+            password: Password to verify
+
+        Returns:
+            bool: True if password matches hash
+        """
+        loaded = self._load_hash_cached()
+        if loaded is None:
+            return False
+        salt, stored_hash = loaded
+
+        try:
+            # Verify password using same PBKDF2 parameters; compare_digest
+            # keeps the comparison constant-time
+            candidate = hashlib.pbkdf2_hmac(
+                'sha256', password.encode(), salt, PBKDF2_ITERATIONS, PBKDF2_KEY_LENGTH)
+            return hmac.compare_digest(candidate, stored_hash)
         except Exception:
             return False
-    
+
     def has_password_verification_hash(self) -> bool:
         """Check if password verification hash exists.
-        
+
         Returns:
             bool: True if hash file exists
         """
-        hash_files = list(BRIAR_NOTIFY_DIR.glob('*.hash'))
-        return len(hash_files) > 0
+        return self._load_hash_cached() is not None
 
 
 # Global instance
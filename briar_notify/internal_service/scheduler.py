@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 
+import hashlib
+import heapq
+import itertools
 import json
+import os
 import threading
 import time
 import sys
 from datetime import datetime
+
+import orjson
 from typing import List, Dict, Any, Optional
 from internal_service.service_config import BRIAR_NOTIFY_DIR, DEFAULT_BRIAR_PORT
-from internal_service.briar_service import get_contacts, send_message, broadcast_message
+from internal_service.briar_service import get_contacts, send_message_async, broadcast_message
 
 
 
@@ -18,16 +24,147 @@ class MessageScheduler:
         self.wake_event = threading.Event()
         self.messages_path = BRIAR_NOTIFY_DIR / 'scheduled_messages.json'
         self.default_sleep_seconds = 60
+        # How long dirty state may sit in memory before the flush thread
+        # persists it. Bursts of mutations within this window coalesce
+        # into one serialization + one atomic rename; the tradeoff is up
+        # to this many seconds of durability exposure on a hard crash.
+        self.flush_interval_seconds = 0.2
         BRIAR_NOTIFY_DIR.mkdir(parents=True, exist_ok=True)
-    
-    
+
+        # In-memory min-heap of (scheduled_timestamp, seq, msg) is the
+        # working copy of the queue: peek/pop/insert are O(log N) with no
+        # file I/O per tick. The JSON file stays the on-disk format (other
+        # components read and edit it directly), so the heap is reloaded
+        # whenever the file changes out from under us.
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._heap: List[tuple] = []
+        # Secondary index: lowercased reset word -> ids of dead-man's-
+        # switch messages carrying it. Deleting by reset word is then an
+        # index lookup instead of lowercasing every stored word.
+        self._by_reset_word: Dict[str, set] = {}
+        # Lazy deletion: ids in this set are dead but still sit in the
+        # heap; pops skip them and saves filter them out. Avoids O(N)
+        # heap surgery per delete - entries drain as they surface.
+        self._tombstones: set = set()
+        self._store_key = None  # (mtime_ns, size) of the file the heap mirrors
+        self._dirty = threading.Event()
+        self._flush_thread = None
+        self._contacts_cache = None  # (fetched_at, name_to_contact)
+        self._contacts_ttl = 30  # seconds
+        with self._lock:
+            self._reload_heap()
+
+    def _load_messages(self) -> List[Dict[str, Any]]:
+        """Load the scheduled messages list ([] if missing or corrupt)."""
+        try:
+            return orjson.loads(self.messages_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return []
+
+    def _store_stat_key(self):
+        """Current (mtime_ns, size) of the store, or None if missing."""
+        try:
+            st = self.messages_path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _reload_heap(self):
+        """Rebuild the heap from the file. Caller holds the lock."""
+        messages = self._load_messages()
+        self._heap = [(msg['scheduled_timestamp'], next(self._seq), msg)
+                      for msg in messages]
+        heapq.heapify(self._heap)
+        self._by_reset_word = {}
+        for msg in messages:
+            if msg.get('dead_mans_switch') and msg.get('reset_word'):
+                self._by_reset_word.setdefault(
+                    msg['reset_word'].lower(), set()).add(msg.get('id'))
+        self._tombstones.clear()
+        self._store_key = self._store_stat_key()
+
+    def _sync_with_store(self):
+        """Reload if the file was edited externally. Caller holds the lock.
+
+        The web UI rewrites scheduled_messages.json directly, so a cheap
+        stat comparison per tick keeps the heap honest without re-parsing
+        an unchanged file. Skipped while the heap holds unflushed
+        mutations - reloading then would discard them.
+        """
+        if self._dirty.is_set():
+            return
+        if self._store_stat_key() != self._store_key:
+            self._reload_heap()
+
+    def _save_heap(self):
+        """Persist the heap to the store atomically. Caller holds the lock.
+
+        Serializes once with orjson (compact - the file is machine-read),
+        writes to a temp file, fsyncs, then renames over the store so a
+        crash mid-write can't tear the file. Entries are written in firing
+        order so the on-disk file stays deterministic. Underscore-prefixed
+        keys are derived in-memory state (e.g. rendered payload templates)
+        and are not persisted, and neither are tombstoned entries.
+        """
+        messages = [{k: v for k, v in entry[2].items() if not k.startswith('_')}
+                    for entry in sorted(self._heap)
+                    if entry[2].get('id') not in self._tombstones]
+        buf = orjson.dumps(messages)
+        tmp_path = self.messages_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.messages_path)
+        self._store_key = self._store_stat_key()
+
+    def _compact_if_needed(self):
+        """Rebuild the heap without tombstoned entries. Caller holds the lock.
+
+        Skipping on pop keeps deletes cheap, but a heap that is mostly
+        corpses wastes memory and slows every sift; once tombstones pass
+        a quarter of the heap, one filter + heapify reclaims it.
+        """
+        if len(self._tombstones) <= len(self._heap) // 4:
+            return
+        self._heap = [entry for entry in self._heap
+                      if entry[2].get('id') not in self._tombstones]
+        heapq.heapify(self._heap)
+        self._tombstones.clear()
+
+    def _mark_dirty(self):
+        """Queue a persist of the heap for the flush thread."""
+        self._dirty.set()
+
+    def _flush_loop(self):
+        # Waits for dirty state, lets the coalesce window pass so a burst
+        # of mutations lands in one write, then persists.
+        while self.running:
+            if not self._dirty.wait(timeout=1):
+                continue
+            time.sleep(self.flush_interval_seconds)
+            self._flush_now()
+
+    def _flush_now(self):
+        if not self._dirty.is_set():
+            return
+        with self._lock:
+            self._dirty.clear()
+            try:
+                self._save_heap()
+            except Exception:
+                self._dirty.set()
+
     def start(self):
         if self.running:
             return
         self.running = True
         self.thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.thread.start()
-    
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+
     def stop(self):
         if not self.running:
             return
@@ -35,6 +172,10 @@ class MessageScheduler:
         self.wake_event.set()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
+        if self._flush_thread and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=5)
+        # Final synchronous flush so shutdown never drops mutations
+        self._flush_now()
     
     def add_message(self, title: str, content: str, scheduled_time: datetime,
                    recipients: Optional[List[str]] = None, json_payload: bool = False,
@@ -42,11 +183,17 @@ class MessageScheduler:
                    original_interval_seconds: int = 0) -> str:
         
         
-        message_id = f"msg_{int(time.time())}_{hash(title + content) % 10000:04d}"
+        # blake2b of the raw parts (NUL-separated so boundaries can't
+        # collide) gives a stable, collision-resistant id - unlike str
+        # hash(), which is salted per process and was folded mod 10000
+        current_time = int(time.time())  # read the clock once per add
+        digest = hashlib.blake2b(
+            title.encode() + b'\x00' + content.encode(), digest_size=6).hexdigest()
+        message_id = f"msg_{current_time}_{digest}"
         timestamp = int(scheduled_time.timestamp())
-        current_time = int(time.time())
-        
-        
+
+
+
         if timestamp <= current_time:
             return None
         
@@ -61,26 +208,55 @@ class MessageScheduler:
             'reset_word': reset_word,
             'original_interval_seconds': original_interval_seconds
         }
-        
+
+        # Resolve recipient names to contact IDs once at schedule time so
+        # the fire path can skip the contacts round-trip. Only stored when
+        # every name resolves - otherwise the send path falls back to
+        # resolving at fire time, same as records written by older code.
+        if recipients:
+            name_to_contact = self._get_name_to_contact()
+            if name_to_contact:
+                contact_ids = [name_to_contact[name].get('contactId')
+                               for name in recipients if name in name_to_contact]
+                if len(contact_ids) == len(recipients):
+                    message_data['recipient_contact_ids'] = contact_ids
+
+        # Derived, not persisted (underscore keys are stripped on save):
+        # render the static part of the outgoing payload once here so
+        # _send_message only splices in the send timestamp
+        if json_payload:
+            message_data['_template'] = ('{"title":%s,"content":%s,"sent_timestamp":'
+                                         % (json.dumps(title), json.dumps(content)))
+        else:
+            message_data['_template'] = f"{title}\n\n{content}\n\nSent: "
+
         # Store message in single unencrypted database
-        try:
-            with open(self.messages_path, 'r') as f:
-                messages = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            messages = []
-        
-        messages.append(message_data)
-        
-        with open(self.messages_path, 'w') as f:
-            json.dump(messages, f, indent=2)
-        
-        self.wake_event.set()
+        with self._lock:
+            self._sync_with_store()
+            heapq.heappush(self._heap, (timestamp, next(self._seq), message_data))
+            if dead_mans_switch and reset_word:
+                self._by_reset_word.setdefault(reset_word.lower(), set()).add(message_id)
+            self._mark_dirty()
+            became_head = self._heap[0][2] is message_data
+
+        # Only wake the loop when this message is the new earliest
+        # deadline; anything later fires on the already-computed wakeup,
+        # so signalling for it would just cause a spurious tick
+        if became_head:
+            self.wake_event.set()
         return message_id
     
     def _scheduler_loop(self):
         while self.running:
             try:
-                self._process_due_messages()
+                # Cheap unlocked peek: a wake from add/delete usually
+                # just moved the deadline, so when the head is still in
+                # the future skip the processing pass (lock + store
+                # sync + pop loop) and go straight to recomputing the
+                # sleep - which takes the lock and syncs anyway.
+                heap = self._heap
+                if not heap or heap[0][0] <= int(time.time()):
+                    self._process_due_messages()
                 sleep_time = self._get_sleep_time()
                 self.wake_event.wait(sleep_time)
                 self.wake_event.clear()
@@ -89,56 +265,100 @@ class MessageScheduler:
     
     def _process_due_messages(self):
         current_time = int(time.time())
-        
-        # Load messages from single database
-        try:
-            with open(self.messages_path, 'r') as f:
-                messages = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return
-        
-        if not messages:
-            return
-        
-        due_messages = []
-        remaining_messages = []
-        
-        for msg in messages:
-            msg_time = msg['scheduled_timestamp']
-            msg_id = msg.get('id', 'unknown')
-            msg_title = msg.get('title', 'no title')
-            reset_word = msg.get('reset_word', '')
-            
-            if msg_time <= current_time:
+
+        # Pop everything due off the heap under the lock, then send
+        # outside it so slow HTTP calls don't block add/delete
+        with self._lock:
+            self._sync_with_store()
+            due_messages = []
+            while self._heap and self._heap[0][0] <= current_time:
+                msg = heapq.heappop(self._heap)[2]
+                if msg.get('id') in self._tombstones:
+                    self._tombstones.discard(msg.get('id'))
+                    continue
                 due_messages.append(msg)
-                self._send_message(msg)
-            else:
-                remaining_messages.append(msg)
-        
-        
-        # Update storage if messages were processed
-        if len(remaining_messages) != len(messages):
-            with open(self.messages_path, 'w') as f:
-                json.dump(remaining_messages, f, indent=2)
-        else:
-            pass
+
+            # Update storage if messages were processed
+            if due_messages:
+                self._mark_dirty()
+
+        # Coalesce plain-text broadcasts that fired on the same tick:
+        # each broadcast_message call fans out to every contact, so k
+        # simultaneous broadcasts cost k sends per contact - joining
+        # their payloads makes it one. JSON-payload and per-recipient
+        # messages keep their own sends (their payloads can't be
+        # concatenated / their recipient sets differ).
+        broadcasts = [msg for msg in due_messages
+                      if msg.get('recipients') is None and not msg.get('json_payload')]
+        if len(broadcasts) > 1:
+            joined_text = '\n\n---\n\n'.join(self._render_text(msg)
+                                             for msg in broadcasts)
+            try:
+                broadcast_message(joined_text, DEFAULT_BRIAR_PORT)
+            except Exception:
+                pass
+            due_messages = [msg for msg in due_messages
+                            if msg.get('recipients') is not None or msg.get('json_payload')]
+
+        for msg in due_messages:
+            self._send_message(msg)
+
+    def _get_name_to_contact(self) -> Optional[Dict[str, Any]]:
+        """Get the name -> contact mapping, reusing a recent fetch.
+
+        When a burst of messages fires on one tick each used to trigger
+        its own get_contacts round-trip and dict rebuild of identical
+        data; a short TTL collapses that to one fetch per window.
+
+        Returns:
+            dict: Contact name -> contact dict, or None if fetch failed
+        """
+        now = time.monotonic()
+        if self._contacts_cache and now - self._contacts_cache[0] < self._contacts_ttl:
+            return self._contacts_cache[1]
+
+        contacts = get_contacts(DEFAULT_BRIAR_PORT)
+        if not contacts:
+            return None
+
+        name_to_contact = {}
+        for contact in contacts:
+            name = contact.get('author', {}).get('name')
+            if name:
+                name_to_contact[name] = contact
+
+        self._contacts_cache = (now, name_to_contact)
+        return name_to_contact
     
+    def _render_text(self, msg: Dict[str, Any]) -> str:
+        """Render the outgoing payload for a message.
+
+        The static part was rendered into '_template' at add time;
+        records reloaded from disk fall back to rendering it here. Only
+        the send timestamp is spliced in per call.
+
+        Args:
+            msg: Scheduled message record
+
+        Returns:
+            str: Full message text ready to send
+        """
+        template = msg.get('_template')
+        if msg.get('json_payload'):
+            if template is None:
+                template = ('{"title":%s,"content":%s,"sent_timestamp":'
+                            % (json.dumps(msg['title']), json.dumps(msg['content'])))
+            return template + str(int(time.time())) + '}'
+        if template is None:
+            template = f"{msg['title']}\n\n{msg['content']}\n\nSent: "
+        return template + str(int(time.time()))
+
     def _send_message(self, msg: Dict[str, Any]):
         try:
-            if msg.get('json_payload'):
-                message_text = json.dumps({
-                    'title': msg['title'],
-                    'content': msg['content'],
-                    'sent_timestamp': int(time.time())
-                })
-            else:
-                sent_timestamp = int(time.time())
-                
-                # Build message with timestamps
-                message_text = f"{msg['title']}\n\n{msg['content']}\n\nSent: {sent_timestamp}"
-            
+            message_text = self._render_text(msg)
+
             # Use imported functions
-            
+
             recipients = msg.get('recipients')
             if recipients is None:
                 # Broadcast to all contacts
@@ -148,28 +368,22 @@ class MessageScheduler:
                 else:
                     pass
             else:
-                # Send to specific recipients
-                contacts = get_contacts(DEFAULT_BRIAR_PORT)
-                if not contacts:
-                    return
-                
-                # Build name to contact mapping
-                name_to_contact = {}
-                for contact in contacts:
-                    name = contact.get('author', {}).get('name')
-                    if name:
-                        name_to_contact[name] = contact
-                
-                delivered_count = 0
-                for recipient_name in recipients:
-                    if recipient_name in name_to_contact:
-                        contact = name_to_contact[recipient_name]
-                        contact_id = contact.get('contactId')
-                        
-                        result = send_message(contact_id, message_text, DEFAULT_BRIAR_PORT)
-                        if result:
-                            delivered_count += 1
-                
+                # Send to specific recipients - IDs resolved at schedule
+                # time when available, by name lookup otherwise
+                contact_ids = msg.get('recipient_contact_ids')
+                if contact_ids is None:
+                    name_to_contact = self._get_name_to_contact()
+                    if not name_to_contact:
+                        return
+                    contact_ids = [name_to_contact[name].get('contactId')
+                                   for name in recipients if name in name_to_contact]
+
+                # Fan the independent HTTP sends out on the shared pool;
+                # dispatch latency is the slowest single send, not the sum
+                futures = [send_message_async(contact_id, message_text, DEFAULT_BRIAR_PORT)
+                           for contact_id in contact_ids]
+                delivered_count = sum(1 for future in futures if future.result())
+
                 if delivered_count > 0:
                     pass
                 else:
@@ -179,16 +393,19 @@ class MessageScheduler:
     
     def _get_sleep_time(self) -> float:
         try:
-            with open(self.messages_path, 'r') as f:
-                messages = json.load(f)
-            
+            with self._lock:
+                self._sync_with_store()
+                # Pop-and-skip any tombstoned entries that reached the
+                # head so a dead deadline can't shorten the sleep
+                while self._heap and self._heap[0][2].get('id') in self._tombstones:
+                    self._tombstones.discard(heapq.heappop(self._heap)[2].get('id'))
+                if not self._heap:
+                    return self.default_sleep_seconds
+                next_timestamp = self._heap[0][0]
+
             current_time = int(time.time())
-            future_timestamps = [msg['scheduled_timestamp'] for msg in messages if msg['scheduled_timestamp'] > current_time]
-            
-            if future_timestamps:
-                return max(1, min(min(future_timestamps) - current_time, 300))
-            return self.default_sleep_seconds
-        except (FileNotFoundError, json.JSONDecodeError):
+            return max(1, min(next_timestamp - current_time, 300))
+        except Exception:
             return self.default_sleep_seconds
     
     def delete_messages_by_reset_word(self, reset_word: str) -> bool:
@@ -201,35 +418,27 @@ class MessageScheduler:
             bool: True if successful, False otherwise
         """
         try:
-            
-            try:
-                with open(self.messages_path, 'r') as f:
-                    messages = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                return True
-            
-            # Filter out messages with matching reset word
-            original_count = len(messages)
-            remaining_messages = []
-            deleted_count = 0
-            
-            for msg in messages:
-                if (msg.get('dead_mans_switch') and 
-                    msg.get('reset_word', '').lower() == reset_word.lower()):
-                    deleted_count += 1
-                else:
-                    remaining_messages.append(msg)
-            
-            # Save updated messages
-            with open(self.messages_path, 'w') as f:
-                json.dump(remaining_messages, f, indent=2)
-            
-            
+            target = reset_word.lower()
+            with self._lock:
+                self._sync_with_store()
+                # The index tells us which ids match (and lets a miss
+                # return without touching the heap at all)
+                ids = self._by_reset_word.pop(target, None)
+                if not ids:
+                    return True
+
+                # Mark rather than remove: the entries stay in the heap
+                # and are skipped when popped, so the delete itself is
+                # O(k) regardless of queue size
+                self._tombstones |= ids
+                self._compact_if_needed()
+                self._mark_dirty()
+
             # Wake up the scheduler to recalculate sleep time
             self.wake_event.set()
-            
+
             return True
-            
+
         except Exception as e:
             return False
 
@@ -240,10 +449,18 @@ _scheduler_lock = threading.Lock()
 
 def get_scheduler() -> MessageScheduler:
     global _scheduler_instance
+    # Double-checked locking: after first initialization every call is
+    # a single global read, no lock acquire/release. Safe because the
+    # instance is only published (inside the lock) after start()
+    # returns, and module-global reads are atomic under the GIL.
+    scheduler = _scheduler_instance
+    if scheduler is not None:
+        return scheduler
     with _scheduler_lock:
         if _scheduler_instance is None:
-            _scheduler_instance = MessageScheduler()
-            _scheduler_instance.start()
+            scheduler = MessageScheduler()
+            scheduler.start()
+            _scheduler_instance = scheduler
         return _scheduler_instance
 
 def stop_scheduler():
@@ -15,19 +15,32 @@ arch_mapping = {
     'i386': ('386', 'x86'),
     'i686': ('386', 'x86')
 }
-machine = platform.machine().lower()
-jar_arch, jdk_arch = arch_mapping.get(machine, ('amd64', 'x64'))  # Default to amd64/x64
-
 # Application paths
 BRIAR_DIR = Path.home() / '.briar'
 BRIAR_NOTIFY_DIR = Path.home() / '.briar-notify'
 
-app_dir = Path(__file__).parent.parent.parent
-BRIAR_JAR_PATH = str(app_dir / "briar_headless" / "jar-builds" / "jars" / f'briar-headless-{jar_arch}.jar')
+# Platform-dependent values are computed lazily (PEP 562): most importers
+# of this module (scheduler, DMS, web UI handlers) only need ports and
+# directories and never launch the JAR, so they skip the platform.machine
+# lookup and path construction entirely.
+_lazy_names = ('jar_arch', 'jdk_arch', 'BRIAR_JAR_PATH', 'JAVA_PATH')
+
+def __getattr__(name):
+    if name in _lazy_names:
+        machine = platform.machine().lower()
+        jar_arch, jdk_arch = arch_mapping.get(machine, ('amd64', 'x64'))  # Default to amd64/x64
 
-# Always use bundled Java
-bundled_java = app_dir / 'briar_headless' / 'jdk17' / jdk_arch / 'bin' / 'java'
-JAVA_PATH = str(bundled_java)
+        app_dir = Path(__file__).parent.parent.parent
+        values = {
+            'jar_arch': jar_arch,
+            'jdk_arch': jdk_arch,
+            'BRIAR_JAR_PATH': str(app_dir / "briar_headless" / "jar-builds" / "jars" / f'briar-headless-{jar_arch}.jar'),
+            # Always use bundled Java
+            'JAVA_PATH': str(app_dir / 'briar_headless' / 'jdk17' / jdk_arch / 'bin' / 'java'),
+        }
+        globals().update(values)  # computed once, plain attributes after
+        return values[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Other defaults
 DEFAULT_BRIAR_PORT = 7010  # Normal Briar chat app uses 7000
@@ -37,19 +50,42 @@ WS_URL = f"ws://127.0.0.1:{DEFAULT_BRIAR_PORT}/v1/ws"
 class BriarAuthManager:
     def __init__(self):
         self.token_path = BRIAR_DIR / 'auth_token'
-    
+        self._cached_key = None  # token file mtime the cached headers were built from
+        self._cached_headers = None
+
     def get_token(self):
         if not self.token_path.exists():
             return None
         return self.token_path.read_text().strip()
-    
+
     def get_auth_headers(self):
-        """Get authorization headers for requests"""
-        token = self.get_token()
-        if not token:
+        """Get authorization headers for requests.
+
+        The header dict is cached against the token file's mtime so hot
+        paths (broadcast loops) don't re-read the token and rebuild the
+        dict per call. Callers must not mutate the returned dict; POST
+        bodies should use requests' json= argument, which sets its own
+        Content-Type on the prepared request.
+
+        Returns:
+            dict: Headers, or None if no token is available
+        """
+        try:
+            key = self.token_path.stat().st_mtime_ns
+        except OSError:
+            self._cached_key = None
+            self._cached_headers = None
             return None
-        return {'Authorization': f'Bearer {token}'}
-    
+
+        if key != self._cached_key:
+            token = self.get_token()
+            if not token:
+                return None
+            self._cached_headers = {'Authorization': f'Bearer {token}'}
+            self._cached_key = key
+
+        return self._cached_headers
+
     def has_token(self):
         return self.token_path.exists()
 
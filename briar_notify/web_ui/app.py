@@ -1,17 +1,81 @@
 
+import base64
+import functools
+import hashlib
+import io
+import os
+import re
+import threading
 import time
 from datetime import datetime, timedelta
+
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import qrcode
+except ImportError:
+    qrcode = None  # QR rendering degrades to an error response
 from flask import Flask, render_template, request, redirect, jsonify
-from internal_service.briar_service import get_identity_invite_link, start_briar_process, wait_for_briar_ready, logout_identity, delete_identity, add_contact, get_contacts, remove_contact, broadcast_message, get_contact_info, identity_running, get_identity_name
+from internal_service.briar_service import get_identity_invite_link, start_briar_process, wait_for_briar_ready, logout_identity, delete_identity, add_contact, get_contacts, remove_contacts, broadcast_message, get_contact_info, identity_running, get_identity_name
 from internal_service.scheduler import get_scheduler
 from internal_service.password_manager import password_manager
 from internal_service.service_config import DEFAULT_WEB_UI_PORT, DEFAULT_BRIAR_PORT, JAVA_PATH, BRIAR_JAR_PATH, BRIAR_NOTIFY_DIR
 from internal_service.event_listener import start_event_listener
 from internal_service.dead_mans_switch import get_dead_mans_switch
 from internal_service.jar_monitor import jar_monitor
+from external_client.http_handlers import handle_send_request
+from web_ui.ttl_cache import ttl_cache
 
 app = Flask(__name__)
 
+# Scheduled-message store shared with the scheduler and dead man's
+# switch; resolved once instead of expanduser/join per request
+_MESSAGES_FILE = BRIAR_NOTIFY_DIR / 'scheduled_messages.json'
+
+# Rendered dashboard HTML keyed on the values that appear in it; under
+# auto-refresh the template render is skipped while the inputs and the
+# short freshness window hold
+_dashboard_render_cache = None  # (key, rendered_at, html)
+_DASHBOARD_RENDER_TTL = 3
+
+# Dead man's switch interval units, in seconds per unit
+_UNIT_MULTIPLIERS = {
+    'hours': 3600,
+    'days': 86400,
+    'weeks': 604800,
+    'months': 2629746,  # ~30.44 days
+    'years': 31556952   # ~365.24 days
+}
+
+# briar:// handshake links are the scheme plus a base32-style payload;
+# matching the whole shape up front rejects malformed links before the
+# add-contact RPC is attempted
+_BRIAR_LINK_RE = re.compile(r'^briar://[A-Za-z0-9_\-]+$')
+
+# Constant bodies for the hot polling endpoints, serialized once at
+# import so each hit is a Response wrap with no JSON work
+_HEALTH_BODY = b'{"status":"ok","service":"briar-notify"}'
+_CONTACT_STATUS_EMPTY = (b'{"success":false,"total_contacts":0,'
+                         b'"online_contacts":0,'
+                         b'"contact_display":"Contacts: 0/0 online"}')
+
+# Pre-serialized /get-scheduled-messages body keyed by the store file's
+# (mtime_ns, size); polls against an unchanged file skip the parse and
+# the re-serialization entirely
+_messages_response_cache = None
+
+# Memoized Briar RPC helpers for routes hit by browser polling: the
+# identity name changes only on create/delete (which invalidate it),
+# contact counts only need to be a couple of seconds fresh. The invite
+# link and identity_running are already cached inside briar_service.
+_cached_identity_name = ttl_cache(30)(get_identity_name)
+_cached_contact_info = ttl_cache(2)(get_contact_info)
+
+# Shared pool for overlapping independent Briar RPCs inside a request;
+# created once so handlers don't pay thread startup per hit
+_rpc_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='webui-rpc')
+
 # Load password into memory at startup
 password_manager.load_password_into_memory()
 
@@ -41,7 +105,7 @@ def _check_identity_running():
         tuple: (is_running: bool, error_response: dict or None)
     """
     if not identity_running():
-        if not get_identity_name():
+        if not _cached_identity_name():
             return False, jsonify({'success': False, 'error': 'No identity found', 'redirect': '/'})
         else:
             return False, jsonify({'success': False, 'error': 'Briar identity not running', 'redirect': '/start-identity'})
@@ -59,24 +123,11 @@ def after_request(response):
 def dashboard():
     
     # Fast check - if identity doesn't exist, redirect immediately
-    identity_name = get_identity_name()
-    from pathlib import Path
-    import os
-    
-    # Try direct filesystem calls
-    import os.path
-    
-    if BRIAR_NOTIFY_DIR.exists():
-        hash_files = list(BRIAR_NOTIFY_DIR.glob('*.hash'))
-        # Try with os.listdir too
-        try:
-            os_files = os.listdir(str(BRIAR_NOTIFY_DIR))
-        except Exception as e:
-            pass
+    identity_name = _cached_identity_name()
     if not identity_name:
         return redirect('/identity-setup-required')
-    
-    
+
+
     # Load system password into memory if not already loaded
     if password_manager.identity_password is None:
         if not password_manager.load_password_into_memory():
@@ -88,10 +139,11 @@ def dashboard():
         # Try to start Briar with system password
         system_password = password_manager.identity_password
         if system_password:
-            # Kill any existing process first (don't waste time checking if running)
+            # Kill any existing process first (don't waste time checking
+            # if running); logout blocks until the port is free, so the
+            # new process can be started immediately
             logout_identity()
-            time.sleep(1)  # Reduced from 3 seconds
-            
+
             # Start Briar with system password
             proc = start_briar_process(system_password, DEFAULT_BRIAR_PORT)
             
@@ -105,20 +157,33 @@ def dashboard():
             # No system password available
             return redirect('/identity-setup-required')
 
-    # Get contact information
-    contact_info = get_contact_info()
+    # Contact info and the invite link are independent RPCs; overlap
+    # them so the render waits for the slower of the two, not the sum
+    info_future = _rpc_pool.submit(_cached_contact_info)
+    invite_link = get_identity_invite_link()
+    contact_info = info_future.result()
+
     if contact_info:
         contact_display = f"Contacts: {contact_info['online_contacts']}/{contact_info['total_contacts']} online"
     else:
         contact_display = "Contacts: 0/0 online"
 
-    invite_link = get_identity_invite_link()
-    return render_template('dashboard.html', 
-                         status="Container Running",
-                         briar_status="Connected",
-                         contact_display=contact_display,
-                         identity=invite_link,
-                         identity_name=identity_name)
+    # Reuse the rendered page while everything it displays is unchanged
+    global _dashboard_render_cache
+    key = (identity_name, invite_link, contact_display)
+    cached = _dashboard_render_cache
+    if (cached and cached[0] == key
+            and time.monotonic() - cached[1] < _DASHBOARD_RENDER_TTL):
+        return cached[2]
+
+    html = render_template('dashboard.html',
+                           status="Container Running",
+                           briar_status="Connected",
+                           contact_display=contact_display,
+                           identity=invite_link,
+                           identity_name=identity_name)
+    _dashboard_render_cache = (key, time.monotonic(), html)
+    return html
 
 @app.route('/identity-setup-required')
 def identity_setup_required():
@@ -136,33 +201,96 @@ def identity_setup_required():
     '''
 
 
-@app.route('/create-identity', methods=['POST'])
-def create_identity():
-    nickname = request.form['nickname']
-    
-    # Create auto-generated password
-    auto_password = password_manager.create_auto_generated_identity_password(nickname)
-    if not auto_password:
-        # Failed to generate/save password
-        return redirect('/identity-setup-required')
-    
-    # Kill any existing Briar processes
-    logout_identity()
-    time.sleep(2)
-    
-    # Start Briar with identity creation data using auto-generated password
-    input_data = f"{nickname}\n{auto_password}\n{auto_password}\n"
-    proc = start_briar_process(input_data, DEFAULT_BRIAR_PORT)
-    
-    # Wait for Briar API to be ready
-    if wait_for_briar_ready():
+# Identity-creation progress shared between the background startup
+# thread and the /identity-status poller
+_startup_lock = threading.Lock()
+_startup_state = {'phase': 'idle', 'error': None}
+
+
+def _do_create_identity(nickname: str):
+    """Create the identity and start Briar; runs on a background thread."""
+    try:
+        # Create auto-generated password
+        auto_password = password_manager.create_auto_generated_identity_password(nickname)
+        if not auto_password:
+            raise RuntimeError('Failed to generate identity password')
+
+        # Kill any existing Briar processes; logout blocks on port release
+        logout_identity()
+
+        # Start Briar with identity creation data using auto-generated password
+        input_data = f"{nickname}\n{auto_password}\n{auto_password}\n"
+        start_briar_process(input_data, DEFAULT_BRIAR_PORT)
+
+        # Wait for Briar API to be ready
+        if not wait_for_briar_ready():
+            raise RuntimeError('Briar did not become ready')
+
         # Save password verification hash
         password_manager.save_password_verification_hash(auto_password, nickname)
         # Initialize scheduler for new identity
         _initialize_processes(auto_password)
-        return redirect('/')
-    else:
-        return redirect('/identity-setup-required')
+        _cached_identity_name.invalidate()
+        _cached_contact_info.invalidate()
+        _render_qr.cache_clear()
+        _clear_qr_files()
+        with _startup_lock:
+            _startup_state['phase'] = 'ready'
+    except Exception as e:
+        with _startup_lock:
+            _startup_state['phase'] = 'error'
+            _startup_state['error'] = str(e)
+
+
+@app.route('/create-identity', methods=['POST'])
+def create_identity():
+    nickname = request.form['nickname']
+
+    # The multi-second Briar startup runs on a background thread so the
+    # POST returns immediately; the progress page polls /identity-status
+    with _startup_lock:
+        if _startup_state['phase'] == 'starting':
+            return redirect('/identity-starting')
+        _startup_state['phase'] = 'starting'
+        _startup_state['error'] = None
+
+    threading.Thread(target=_do_create_identity, args=(nickname,), daemon=True).start()
+    return redirect('/identity-starting')
+
+
+@app.route('/identity-starting')
+def identity_starting():
+    return '''
+    <html>
+    <head><title>Creating Identity</title></head>
+    <body style="font-family: Arial, sans-serif; margin: 60px auto; max-width: 600px; background: white;">
+        <h2>Creating Identity...</h2>
+        <p id="status">Starting Briar, this can take a few seconds.</p>
+        <script>
+        function poll() {
+            fetch('/identity-status').then(r => r.json()).then(data => {
+                if (data.phase === 'ready') {
+                    window.location = '/';
+                } else if (data.phase === 'error') {
+                    document.getElementById('status').textContent =
+                        'Failed to create identity: ' + (data.error || 'unknown error');
+                } else {
+                    setTimeout(poll, 1000);
+                }
+            }).catch(() => setTimeout(poll, 1000));
+        }
+        poll();
+        </script>
+    </body>
+    </html>
+    '''
+
+
+@app.route('/identity-status')
+def identity_status():
+    with _startup_lock:
+        return jsonify({'phase': _startup_state['phase'],
+                        'error': _startup_state['error']})
 
 
 
@@ -172,6 +300,10 @@ def delete_identity_route():
     # Stop scheduler if running
     _cleanup_scheduler()
     delete_identity()  # Kill process and remove all data
+    _cached_identity_name.invalidate()
+    _cached_contact_info.invalidate()
+    _render_qr.cache_clear()
+    _clear_qr_files()
     # Redirect to main route which will show create identity page
     return redirect('/')
 
@@ -199,12 +331,13 @@ def add_contact_route():
     if not briar_link or not alias:
         return jsonify({'success': False, 'error': 'Both Briar link and alias are required'})
     
-    if not briar_link.startswith('briar://'):
+    if not _BRIAR_LINK_RE.match(briar_link):
         return jsonify({'success': False, 'error': 'Invalid Briar link format'})
     
     result = add_contact(briar_link, alias)
-    
+
     if result:
+        _cached_contact_info.invalidate()
         return jsonify({'success': True, 'data': result})
     else:
         return jsonify({'success': False, 'error': 'Failed to add contact'})
@@ -218,19 +351,18 @@ def remove_contacts_route():
         return error_response
     
     contact_ids = request.json.get('contact_ids', [])
-    
+
     if not contact_ids:
         return jsonify({'success': False, 'error': 'No contacts selected'})
-    
-    success_count = 0
-    failed_count = 0
-    
-    for contact_id in contact_ids:
-        if remove_contact(contact_id):
-            success_count += 1
-        else:
-            failed_count += 1
-    
+
+    # One concurrent batch instead of sequential per-contact round-trips
+    results = remove_contacts(contact_ids)
+    success_count = sum(1 for ok in results.values() if ok)
+    failed_count = len(results) - success_count
+
+    if success_count:
+        _cached_contact_info.invalidate()
+
     if failed_count == 0:
         return jsonify({'success': True, 'message': f'Successfully removed {success_count} contacts'})
     elif success_count == 0:
@@ -278,18 +410,11 @@ def broadcast_message_route():
             if amount <= 0:
                 return jsonify({'success': False, 'error': 'Interval amount must be positive'})
             
-            unit_multipliers = {
-                'hours': 3600,
-                'days': 86400,
-                'weeks': 604800,
-                'months': 2629746,  # ~30.44 days
-                'years': 31556952   # ~365.24 days
-            }
-            
-            if dms_unit not in unit_multipliers:
+            multiplier = _UNIT_MULTIPLIERS.get(dms_unit)
+            if multiplier is None:
                 return jsonify({'success': False, 'error': 'Invalid time unit'})
-            
-            interval_seconds = amount * unit_multipliers[dms_unit]
+
+            interval_seconds = amount * multiplier
             
             # Create dead man's switch
             dms = get_dead_mans_switch()
@@ -360,10 +485,10 @@ def broadcast_message_route():
             return jsonify({'success': False, 'error': f'Failed to schedule message: {e}'})
     
     else:
-        # Immediate broadcast with proper formatting
-        import time
-        timestamp = int(time.time())
-        formatted_message = f"{message_title}\n\n{message_text}\n\nSent: {timestamp}"
+        # Immediate broadcast with proper formatting; one join over str
+        # parts skips the f-string formatting machinery on this path
+        formatted_message = ''.join((message_title, '\n\n', message_text,
+                                     '\n\nSent: ', str(int(time.time()))))
         result = broadcast_message(formatted_message)
         
         if result['success']:
@@ -381,128 +506,161 @@ def broadcast_message_route():
 @app.route('/contact-status')
 def contact_status():
     """Get current contact status for auto-refresh."""
-    contact_info = get_contact_info()
+    contact_info = _cached_contact_info()
     if contact_info:
-        return jsonify({
+        body = orjson.dumps({
             'success': True,
             'total_contacts': contact_info['total_contacts'],
             'online_contacts': contact_info['online_contacts'],
             'contact_display': f"Contacts: {contact_info['online_contacts']}/{contact_info['total_contacts']} online"
         })
     else:
-        return jsonify({
-            'success': False,
-            'total_contacts': 0,
-            'online_contacts': 0,
-            'contact_display': "Contacts: 0/0 online"
-        })
+        body = _CONTACT_STATUS_EMPTY
+    return app.response_class(body, mimetype='application/json')
+
+@functools.lru_cache(maxsize=4)
+def _render_qr(invite_link):
+    """Render the invite link as a base64 PNG data URL.
+
+    The link is stable for the life of an identity, so the QR build,
+    PNG encode, and base64 step only run once per link; repeat requests
+    are a cache lookup. create/delete identity clear the cache.
+
+    Args:
+        invite_link: Briar invite link to encode
+
+    The PNG is also persisted under BRIAR_NOTIFY_DIR keyed by a hash of
+    the link, so a restarted process reuses the rendered image from
+    disk instead of paying the render again.
+
+    Returns:
+        str: data:image/png;base64 URL for the rendered QR code
+    """
+    digest = hashlib.sha256(invite_link.encode()).hexdigest()[:16]
+    png_path = BRIAR_NOTIFY_DIR / f'qr_{digest}.png'
 
-@app.route('/qr-code')
-def qr_code():
-    """Generate QR code for identity."""
-    invite_link = get_identity_invite_link()
-    if not invite_link:
-        return jsonify({'success': False, 'error': 'No identity available'})
-    
     try:
-        import qrcode
-        import io
-        import base64
-        
+        png_bytes = png_path.read_bytes()
+    except OSError:
         qr = qrcode.QRCode(version=1, box_size=10, border=5)
         qr.add_data(invite_link)
         qr.make(fit=True)
-        
+
         img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Convert to base64
+
         buffer = io.BytesIO()
         img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
-        
-        return jsonify({
-            'success': True,
-            'qr_data': f'data:image/png;base64,{img_str}'
-        })
-    except ImportError:
+        png_bytes = buffer.getvalue()
+
+        # Best-effort disk cache, written atomically like the other
+        # stores so a crash can't leave a truncated PNG behind
+        try:
+            tmp_path = png_path.with_suffix('.png.tmp')
+            tmp_path.write_bytes(png_bytes)
+            os.replace(tmp_path, png_path)
+        except OSError:
+            pass
+
+    return 'data:image/png;base64,' + base64.b64encode(png_bytes).decode()
+
+
+def _clear_qr_files():
+    """Remove persisted QR renders; called when the identity changes."""
+    try:
+        for path in BRIAR_NOTIFY_DIR.glob('qr_*.png'):
+            path.unlink()
+    except OSError:
+        pass
+
+@app.route('/qr-code')
+def qr_code():
+    """Generate QR code for identity."""
+    invite_link = get_identity_invite_link()
+    if not invite_link:
+        return jsonify({'success': False, 'error': 'No identity available'})
+
+    if qrcode is None:
         return jsonify({'success': False, 'error': 'QR library not available on server'})
+
+    try:
+        return jsonify({'success': True, 'qr_data': _render_qr(invite_link)})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
 @app.route('/api/send', methods=['POST'])
 def api_send():
     """HTTP API endpoint for CLI tool to send messages."""
-    from external_client.http_handlers import handle_send_request
-    
     result, status_code = handle_send_request(_check_identity_running)
     return jsonify(result), status_code
 
 @app.route('/get-scheduled-messages', methods=['GET'])
 def get_scheduled_messages():
     """Get list of scheduled messages from the JSON file."""
-    import os
-    import json
-    
+    global _messages_response_cache
+
     # Check if Briar identity is running
     is_running, error_response = _check_identity_running()
     if not is_running:
         return error_response
-    
+
     try:
-        # Path to the scheduled messages file
-        home_dir = os.path.expanduser("~")
-        briar_notify_dir = os.path.join(home_dir, ".briar-notify")
-        messages_file = os.path.join(briar_notify_dir, "scheduled_messages.json")
-        
-        if not os.path.exists(messages_file):
-            return jsonify({'success': True, 'messages': []})
-        
-        with open(messages_file, 'r') as f:
-            messages = json.load(f)
-        
-        return jsonify({'success': True, 'messages': messages})
-        
+        # One stat doubles as the existence check and the cache key
+        try:
+            st = os.stat(_MESSAGES_FILE)
+        except FileNotFoundError:
+            return app.response_class(b'{"success":true,"messages":[]}',
+                                      mimetype='application/json')
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _messages_response_cache
+        if cached is None or cached[0] != key:
+            messages = orjson.loads(_MESSAGES_FILE.read_bytes())
+            cached = (key, orjson.dumps({'success': True, 'messages': messages}))
+            _messages_response_cache = cached
+
+        return app.response_class(cached[1], mimetype='application/json')
+
     except Exception as e:
         return jsonify({'success': False, 'error': f'Failed to load scheduled messages: {e}'})
 
 @app.route('/delete-scheduled-messages', methods=['POST'])
 def delete_scheduled_messages():
     """Delete selected scheduled messages from the JSON file."""
-    import os
-    import json
-    
     # Check if Briar identity is running
     is_running, error_response = _check_identity_running()
     if not is_running:
         return error_response
-    
+
     try:
-        message_ids = request.json.get('message_ids', [])
-        
+        # Set membership makes the filter below O(1) per row instead of
+        # scanning the id list for every message
+        message_ids = set(request.json.get('message_ids', []))
+
         if not message_ids:
             return jsonify({'success': False, 'error': 'No message IDs provided'})
-        
-        # Path to the scheduled messages file
-        home_dir = os.path.expanduser("~")
-        briar_notify_dir = os.path.join(home_dir, ".briar-notify")
-        messages_file = os.path.join(briar_notify_dir, "scheduled_messages.json")
-        
-        if not os.path.exists(messages_file):
+
+        # Load existing messages; the open doubles as the existence
+        # check so the file isn't stat'ed twice
+        try:
+            messages = orjson.loads(_MESSAGES_FILE.read_bytes())
+        except FileNotFoundError:
             return jsonify({'success': False, 'error': 'No scheduled messages file found'})
-        
-        # Load existing messages
-        with open(messages_file, 'r') as f:
-            messages = json.load(f)
-        
+
         # Filter out the messages to delete
         original_count = len(messages)
         messages = [msg for msg in messages if msg.get('id') not in message_ids]
         deleted_count = original_count - len(messages)
-        
-        # Write back to file
-        with open(messages_file, 'w') as f:
-            json.dump(messages, f, indent=2)
-        
+
+        # Atomic compact rewrite: temp file + fsync + rename, same as the
+        # scheduler and dead man's switch write this file, so a crash
+        # mid-write can't tear it
+        tmp_path = _MESSAGES_FILE.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(messages))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, _MESSAGES_FILE)
+
         return jsonify({
             'success': True, 
             'deleted_count': deleted_count,
@@ -514,7 +672,7 @@ def delete_scheduled_messages():
 
 @app.route('/health')
 def health():
-    return {"status": "ok", "service": "briar-notify"}
+    return app.response_class(_HEALTH_BODY, mimetype='application/json')
 
 if __name__ == '__main__':
     import signal
@@ -522,6 +680,7 @@ if __name__ == '__main__':
     
     def signal_handler(signum, frame):
         _cleanup_scheduler()
+        _rpc_pool.shutdown(wait=False, cancel_futures=True)
         sys.exit(0)
     
     # Register signal handlers for graceful shutdown
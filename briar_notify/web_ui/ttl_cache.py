@@ -0,0 +1,47 @@
+import functools
+import threading
+import time
+
+
+def ttl_cache(seconds):
+    """Memoize a zero-argument function for a fixed time window.
+
+    The dashboard and its polling endpoints call the same Briar RPC
+    helpers on every hit even though the answers change rarely; a short
+    TTL turns repeat calls within the window into a dict-free in-memory
+    read. Falsy results (None, failed fetches) are never cached, so a
+    transient RPC failure doesn't stick around for the whole TTL.
+
+    Args:
+        seconds: How long a cached value stays fresh
+
+    Returns:
+        Decorator; the wrapped function gains an invalidate() attribute
+        that drops the cached value immediately (used by routes that
+        mutate the underlying state)
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        cached = None  # (fetched_at, value)
+
+        @functools.wraps(func)
+        def wrapper():
+            nonlocal cached
+            with lock:
+                if cached and time.monotonic() - cached[0] < seconds:
+                    return cached[1]
+            value = func()
+            if value:
+                with lock:
+                    cached = (time.monotonic(), value)
+            return value
+
+        def invalidate():
+            nonlocal cached
+            with lock:
+                cached = None
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator